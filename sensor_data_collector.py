@@ -4,60 +4,148 @@ FarmBeats Sensor Data Collector
 A single-file application for reading sensor data and logging to CSV and log files.
 """
 
+import asyncio
+import atexit
+import collections
 import datetime
 import time
 import csv
+import importlib
+import io
 import logging
 import os
+import queue
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple
 
+# Sensor drivers are optional so the collector still runs on partial hardware
+_DRIVERS = (
+    ('seeed_dht', 'DHT'),
+    ('seeed_ds18b20', 'grove_ds18b20'),
+    ('grove.adc', 'ADC'),
+    ('seeed_si115x', 'grove_si115x'),
+    ('grove.grove_relay', 'GroveRelay'),
+)
+_loaded_drivers = {}
+
+def _load_driver(module_name, attr):
+    """Import a sensor driver class once, returning (driver, error)."""
+    key = (module_name, attr)
+    if key in _loaded_drivers:
+        return _loaded_drivers[key]
+    try:
+        result = (getattr(importlib.import_module(module_name), attr), None)
+    except ImportError as e:
+        # Not installed: cache the failure so the sensor stays disabled
+        result = (None, e)
+    except Exception as e:
+        # Installed but failed to load (e.g. GPIO off a Pi): retry on next setup
+        return None, e
+    _loaded_drivers[key] = result
+    return result
+
+for _module_name, _attr in _DRIVERS:
+    _load_driver(_module_name, _attr)
+
 # ============================================================================
 # BASE SENSOR CLASS
 # ============================================================================
 
+class RollingWindow:
+    """Fixed-size window of measurements with an incrementally maintained sum."""
+    
+    __slots__ = ('size', 'measurements', 'total')
+
+    def __init__(self, size):
+        self.size = size
+        self.measurements = collections.deque(maxlen=size)
+        self.total = 0.0
+
+    def __len__(self):
+        return len(self.measurements)
+
+    def append(self, measurement):
+        """Add a measurement, evicting the oldest one once the window is full."""
+        if len(self.measurements) == self.size:
+            self.total -= self.measurements[0]
+        self.measurements.append(measurement)
+        self.total += measurement
+
+
 class BaseSensor:
     """Base class for all sensors."""
     
-    def __init__(self):
+    def __init__(self, window_size=10):
         self.null_value = 0
         self.sensor = None
-        self.measurements = []
+        self.measurements = RollingWindow(window_size)
         self.upper_reasonable_bound = 200
         self.lower_reasonable_bound = 0
         self.init = False
+        # Set when the driver is not installed; the sensor is never retried
+        self.disabled = False
+        self._next_setup_attempt = 0.0
+        self._setup_backoff = 1.0
 
     def setup(self):
         """Initialize the sensor."""
         self.sensor = None
 
+    def _ensure_setup(self):
+        """Retry setup with exponential backoff; return whether the sensor is ready."""
+        if self.init:
+            return True
+        if self.disabled:
+            return False
+        now = time.monotonic()
+        if now < self._next_setup_attempt:
+            return False
+        self.setup()
+        if self.init:
+            self._setup_backoff = 1.0
+        else:
+            self._next_setup_attempt = now + self._setup_backoff
+            self._setup_backoff = min(60.0, self._setup_backoff * 2)
+        return self.init
+
     def read(self):
         """Read sensor data."""
         return None
 
-    def average(self, measurements):
-        """Calculate average of measurements."""
-        if len(measurements) != 0:
-            return sum(measurements) / len(measurements)
+    def average(self, window):
+        """Calculate average of the measurements in a rolling window."""
+        if len(window) != 0:
+            return window.total / len(window)
         else:
             return self.null_value
 
-    def rolling_average(self, measurement, measurements, size):
+    def rolling_average(self, measurement, window):
         """Calculate rolling average with bounds checking."""
         if measurement is None:
             return None
         if self.lower_reasonable_bound < measurement < self.upper_reasonable_bound:
-            if len(measurements) >= size:
-                measurements.pop(0)
-            measurements.append(measurement)
-        return self.average(measurements)
+            window.append(measurement)
+        return self.average(window)
 
     def mapNum(self, val, old_max, old_min, new_max, new_min):
         """Map a value from one range to another."""
         try:
-            old_range = float(old_max - old_min)
-            new_range = float(new_max - new_min)
-            new_value = float(((val - old_min) * new_range) / old_range) + new_min
-            return new_value
+            scale, offset = self.linear_map(old_max, old_min, new_max, new_min)
+        except Exception:
+            return val
+        return self.apply_map(val, scale, offset)
+
+    def linear_map(self, old_max, old_min, new_max, new_min):
+        """Return the (scale, offset) pair that maps one range onto another."""
+        scale = float(new_max - new_min) / float(old_max - old_min)
+        return scale, new_min - old_min * scale
+
+    def apply_map(self, val, scale, offset):
+        """Map a value with a precomputed (scale, offset) pair from linear_map."""
+        try:
+            return val * scale + offset
         except Exception:
             return val
 
@@ -73,50 +161,63 @@ class AirTemperatureHumiditySensor(BaseSensor):
         BaseSensor.__init__(self)
         self.dht_pin = 16
         self.dht_type = '11'
-        self.humidity_measurements = []
-        self.temperature_measurements = []
+        self.humidity_measurements = RollingWindow(10)
+        self.temperature_measurements = RollingWindow(10)
+        self._next_retry = 0.0
+        self._retry_backoff = 1.0
         self.sensor = None
-        self.setup()
+        self._ensure_setup()
 
     def setup(self):
         """Initialize the DHT sensor."""
+        DHT, error = _load_driver('seeed_dht', 'DHT')
+        if DHT is None:
+            logging.error("AirTemperatureHumiditySensor.setup: %s", error)
+            self.init = False
+            self.disabled = isinstance(error, ImportError)
+            return
         try:
-            from seeed_dht import DHT
             self.sensor = DHT(self.dht_type, self.dht_pin)
             self.init = True
         except Exception as e:
-            logging.error(f"AirTemperatureHumiditySensor.setup: {e}")
+            logging.error("AirTemperatureHumiditySensor.setup: %s", e)
             self.init = False
 
     def read(self):
         """Read air humidity and temperature."""
         air_humidity, air_temperature = self._take_readings()
 
-        if (air_humidity == 0 or air_temperature == 0):
+        if (air_humidity != 0 and air_temperature != 0):
+            self._retry_backoff = 1.0
+        elif self.init and time.monotonic() >= self._next_retry:
+            # Retry once, keeping whichever channel already read fine
             time.sleep(0.1)
             reH, reT = self._take_readings()
             if (air_humidity == 0):
                 air_humidity = reH
             if (air_temperature == 0):
                 air_temperature = reT
+            if (air_humidity == 0 or air_temperature == 0):
+                # Retrying didn't help; hold off before paying for another one
+                self._next_retry = time.monotonic() + self._retry_backoff
+                self._retry_backoff = min(60.0, self._retry_backoff * 2)
 
-        air_humidity = self.rolling_average(air_humidity, self.humidity_measurements, 10)
-        air_temperature = self.rolling_average(air_temperature, self.temperature_measurements, 10)
+        air_humidity = self.rolling_average(air_humidity, self.humidity_measurements)
+        air_temperature = self.rolling_average(air_temperature, self.temperature_measurements)
 
         return air_humidity, air_temperature
 
     def _take_readings(self):
         """Take raw sensor readings."""
         try:
-            if not self.init:
-                self.setup()
+            if not self._ensure_setup():
+                return self.null_value, self.null_value
             air_humidity, air_temperature = self.sensor.read()
+            return air_humidity, air_temperature
         except Exception as e:
-            logging.error(f"AirTemperatureHumiditySensor.read: {e}")
+            logging.error("AirTemperatureHumiditySensor.read: %s", e)
             self.init = False
-            air_humidity, air_temperature = self.null_value, self.null_value
-        finally:
-            return air_humidity, air_temperature
+            return self.null_value, self.null_value
 
 
 class SoilTemperatureSensor(BaseSensor):
@@ -125,67 +226,74 @@ class SoilTemperatureSensor(BaseSensor):
     def __init__(self):
         BaseSensor.__init__(self)
         self.sensor = None
-        self.setup()
+        self._ensure_setup()
 
     def setup(self):
         """Initialize the DS18B20 sensor."""
+        grove_ds18b20, error = _load_driver('seeed_ds18b20', 'grove_ds18b20')
+        if grove_ds18b20 is None:
+            logging.error("SoilTemperatureSensor.setup: %s", error)
+            self.init = False
+            self.disabled = isinstance(error, ImportError)
+            return
         try:
-            from seeed_ds18b20 import grove_ds18b20
             self.sensor = grove_ds18b20()
             self.init = True
         except Exception as e:
-            logging.error(f"SoilTemperatureSensor.setup: {e}")
+            logging.error("SoilTemperatureSensor.setup: %s", e)
             self.init = False
 
     def read(self):
         """Read soil temperature."""
         try:
-            if not self.init:
-                self.setup()
+            if not self._ensure_setup():
+                return self.null_value
             soil_temperature, soil_tempF = self.sensor.read_temp
-            soil_temperature = self.rolling_average(soil_temperature, self.measurements, 10)
+            return self.rolling_average(soil_temperature, self.measurements)
         except Exception as e:
-            logging.error(f"SoilTemperatureSensor.read: {e}")
-            soil_temperature = self.null_value
+            logging.error("SoilTemperatureSensor.read: %s", e)
             self.init = False
-        finally:
-            return soil_temperature
+            return self.null_value
 
 
 class SoilMoistureSensor(BaseSensor):
     """Soil moisture sensor."""
     
     def __init__(self):
-        BaseSensor.__init__(self)
+        BaseSensor.__init__(self, window_size=20)
         self.sensor = None
         self.soil_moisture_pin = 0
-        self.setup()
+        # Grove Capacitive Soil Moisture Sensor (4096-0) - Dry ~2504 Wet ~1543
+        self.moisture_scale, self.moisture_offset = self.linear_map(2504, 1543, 0.00, 1.00)
+        self._ensure_setup()
 
     def setup(self):
         """Initialize the ADC for soil moisture."""
+        ADC, error = _load_driver('grove.adc', 'ADC')
+        if ADC is None:
+            logging.error("SoilMoistureSensor.setup: %s", error)
+            self.init = False
+            self.disabled = isinstance(error, ImportError)
+            return
         try:
-            from grove.adc import ADC
             self.sensor = ADC()
             self.init = True
         except Exception as e:
-            logging.error(f"SoilMoistureSensor.setup: {e}")
+            logging.error("SoilMoistureSensor.setup: %s", e)
             self.init = False
 
     def read(self):
         """Read soil moisture level."""
         try:
-            if not self.init:
-                self.setup()
-            # Grove Capacitive Soil Moisture Sensor (4096-0) - Dry ~2504 Wet ~1543
+            if not self._ensure_setup():
+                return self.null_value
             soil_moisture = self.sensor.read_raw(self.soil_moisture_pin)
-            soil_moisture = self.mapNum(soil_moisture, 2504, 1543, 0.00, 1.00)
-            soil_moisture = self.rolling_average(soil_moisture, self.measurements, 20)
+            soil_moisture = self.apply_map(soil_moisture, self.moisture_scale, self.moisture_offset)
+            return self.rolling_average(soil_moisture, self.measurements)
         except Exception as e:
-            logging.error(f"SoilMoistureSensor.read: {e}")
-            soil_moisture = self.null_value
+            logging.error("SoilMoistureSensor.read: %s", e)
             self.init = False
-        finally:
-            return soil_moisture
+            return self.null_value
 
 
 class SunlightSensor(BaseSensor):
@@ -194,34 +302,36 @@ class SunlightSensor(BaseSensor):
     def __init__(self):
         BaseSensor.__init__(self)
         self.sensor = None
-        self.setup()
+        self._ensure_setup()
 
     def setup(self):
         """Initialize the SI115X sensor."""
+        grove_si115x, error = _load_driver('seeed_si115x', 'grove_si115x')
+        if grove_si115x is None:
+            logging.error("SunlightSensor.setup: %s", error)
+            self.init = False
+            self.disabled = isinstance(error, ImportError)
+            return
         try:
-            from seeed_si115x import grove_si115x
             self.sensor = grove_si115x()
             self.init = True
         except Exception as e:
-            logging.error(f"SunlightSensor.setup: {e}")
+            logging.error("SunlightSensor.setup: %s", e)
             self.init = False
 
     def read(self):
         """Read sunlight measurements (visible, UV, IR)."""
         try:
-            if not self.init:
-                self.setup()
+            if not self._ensure_setup():
+                return (self.null_value, self.null_value, self.null_value)
             sunlight_visible = self.sensor.ReadVisible
             sunlight_uv = self.sensor.ReadUV / 100
-            sunlight_uv = self.rolling_average(sunlight_uv, self.measurements, 10)
+            sunlight_uv = self.rolling_average(sunlight_uv, self.measurements)
             sunlight_ir = self.sensor.ReadIR
-        except Exception as e:
-            logging.error(f"SunlightSensor.read: {e}")
-            sunlight_visible = self.null_value
-            sunlight_uv = self.null_value
-            sunlight_ir = self.null_value
-        finally:
             return (sunlight_visible, sunlight_uv, sunlight_ir)
+        except Exception as e:
+            logging.error("SunlightSensor.read: %s", e)
+            return (self.null_value, self.null_value, self.null_value)
 
 
 class RelaySensor(BaseSensor):
@@ -232,30 +342,33 @@ class RelaySensor(BaseSensor):
         self.sensor = None
         self.soil_moisture_pin = 0
         self.relay_pin = 22
-        self.setup()
+        self._ensure_setup()
 
     def setup(self):
         """Initialize the relay."""
+        GroveRelay, error = _load_driver('grove.grove_relay', 'GroveRelay')
+        if GroveRelay is None:
+            logging.error("RelaySensor.setup: %s", error)
+            self.init = False
+            self.disabled = isinstance(error, ImportError)
+            return
         try:
-            from grove.grove_relay import GroveRelay
             self.sensor = GroveRelay(self.relay_pin)
             self.init = True
         except Exception as e:
-            logging.error(f"RelaySensor.setup: {e}")
+            logging.error("RelaySensor.setup: %s", e)
             self.init = False
 
     def read(self):
         """Read relay state."""
         try:
-            if not self.init:
-                self.setup()
-            relay_state = self.sensor.read()
+            if not self._ensure_setup():
+                return self.null_value
+            return self.sensor.read()
         except Exception as e:
-            logging.error(f"RelaySensor.read: {e}")
+            logging.error("RelaySensor.read: %s", e)
             self.init = False
-            relay_state = self.null_value
-        finally:
-            return relay_state
+            return self.null_value
 
     def on(self):
         """Turn relay on."""
@@ -272,6 +385,21 @@ class RelaySensor(BaseSensor):
 # SENSOR POLLER (CONTROLLER)
 # ============================================================================
 
+# One row of sensor data, in CSV column order
+SensorReading = collections.namedtuple('SensorReading', [
+    'date_time',
+    'soil_temperature',
+    'soil_moisture',
+    'air_temperature',
+    'air_humidity',
+    'sunlight_visible',
+    'sunlight_uv',
+    'sunlight_ir',
+    'relay',
+    'relay_state_change'
+])
+
+
 class SensorPoller:
     """Controller for polling all sensors and managing data collection."""
     
@@ -284,7 +412,11 @@ class SensorPoller:
         self.air_temperature_humidity_sensor = AirTemperatureHumiditySensor()
         self.sunlight_sensor = SunlightSensor()
         self.relay_sensor = RelaySensor()
-        self.previous_relay_state = 0
+        self.previous_relay_state = None if self.relay_sensor.disabled else 0
+        
+        # One worker per sensor so every read in a poll starts at once
+        self._pool = ThreadPoolExecutor(max_workers=5, thread_name_prefix='sensor')
+        atexit.register(self.close)
         
         # Data storage
         self.date_time = None
@@ -298,42 +430,53 @@ class SensorPoller:
         self.relay = None
         self.relay_state_change = False
 
-    def poll_sensors(self):
-        """Poll all sensors and update data."""
+    async def poll_sensors(self):
+        """Poll all sensors concurrently and update data."""
         self.set_date_time()
-        self.set_soil_temperature()
-        self.set_soil_moisture()
-        self.set_air_temperature_humidity()
-        self.set_sunlight()
-        self.set_relay()
+        await asyncio.gather(
+            self.set_soil_temperature(),
+            self.set_soil_moisture(),
+            self.set_air_temperature_humidity(),
+            self.set_sunlight(),
+            self.set_relay()
+        )
         self.set_relay_state_change()
 
     def set_date_time(self):
         """Set current date and time."""
         self.date_time = datetime.datetime.now()
 
-    def set_soil_temperature(self):
+    async def _read_sensor(self, sensor, disabled_value=None):
+        """Run a blocking sensor read in the sensor thread pool."""
+        if sensor.disabled:
+            return disabled_value
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, sensor.read)
+
+    async def set_soil_temperature(self):
         """Read soil temperature sensor."""
-        self.soil_temperature = self.soil_temperature_sensor.read()
+        self.soil_temperature = await self._read_sensor(self.soil_temperature_sensor)
 
-    def set_soil_moisture(self):
+    async def set_soil_moisture(self):
         """Read soil moisture sensor."""
-        self.soil_moisture = self.soil_moisture_sensor.read()
+        self.soil_moisture = await self._read_sensor(self.soil_moisture_sensor)
 
-    def set_air_temperature_humidity(self):
+    async def set_air_temperature_humidity(self):
         """Read air temperature and humidity sensor."""
-        self.air_humidity, self.air_temperature = self.air_temperature_humidity_sensor.read()
+        self.air_humidity, self.air_temperature = await self._read_sensor(
+            self.air_temperature_humidity_sensor, (None, None))
 
-    def set_sunlight(self):
+    async def set_sunlight(self):
         """Read sunlight sensor."""
-        sunlight_visible, sunlight_uv, sunlight_ir = self.sunlight_sensor.read()
+        sunlight_visible, sunlight_uv, sunlight_ir = await self._read_sensor(
+            self.sunlight_sensor, (None, None, None))
         self.sunlight_visible = sunlight_visible
         self.sunlight_uv = sunlight_uv
         self.sunlight_ir = sunlight_ir
 
-    def set_relay(self):
+    async def set_relay(self):
         """Read relay state."""
-        self.relay = self.relay_sensor.read()
+        self.relay = await self._read_sensor(self.relay_sensor)
 
     def set_relay_state_change(self):
         """Detect relay state changes."""
@@ -347,32 +490,42 @@ class SensorPoller:
         finally:
             self.previous_relay_state = self.relay
 
+    def close(self):
+        """Shut down the sensor thread pool."""
+        self._pool.shutdown(wait=True)
+
+    def get_data_row(self):
+        """Get all sensor data as a SensorReading in CSV column order."""
+        raw = (
+            self.soil_temperature,
+            self.soil_moisture,
+            self.air_temperature,
+            self.air_humidity,
+            self.sunlight_visible,
+            self.sunlight_uv,
+            self.sunlight_ir,
+            self.relay
+        )
+        return SensorReading(
+            self.date_time.isoformat(sep=' ', timespec='seconds') if self.date_time else None,
+            *map(self._format_value, raw),
+            self.relay_state_change
+        )
+
     def get_data_dict(self):
         """Get all sensor data as a dictionary."""
-        return {
-            'date_time': self.date_time.strftime("%Y-%m-%d %H:%M:%S") if self.date_time else None,
-            'soil_temperature': self._format_value(self.soil_temperature),
-            'soil_moisture': self._format_value(self.soil_moisture),
-            'air_temperature': self._format_value(self.air_temperature),
-            'air_humidity': self._format_value(self.air_humidity),
-            'sunlight_visible': self._format_value(self.sunlight_visible),
-            'sunlight_uv': self._format_value(self.sunlight_uv),
-            'sunlight_ir': self._format_value(self.sunlight_ir),
-            'relay': self._format_value(self.relay),
-            'relay_state_change': self.relay_state_change
-        }
+        return dict(self.get_data_row()._asdict())
 
     def _format_value(self, value):
         """Format a value for CSV output."""
         if value is None:
             return None
-        try:
-            return float("{:.2f}".format(float(value)))
-        except (ValueError, TypeError):
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                return str(value)
+        # bool is an int subclass, so it must be checked first
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, (int, float)):
+            return round(float(value), 2)
+        return str(value)
 
 
 # ============================================================================
@@ -382,22 +535,32 @@ class SensorPoller:
 class CSVWriter:
     """Handles writing sensor data to CSV files."""
     
-    def __init__(self, csv_file='output/sensor_data.csv'):
+    def __init__(self, csv_file='output/sensor_data.csv', batch_size=64, durable_every_n=0):
+        """
+        Initialize the CSV writer.
+        
+        Flushing only hands rows to the OS page cache; a power cut can still
+        lose them. Setting durable_every_n forces an fsync every N rows, which
+        bounds that loss to N rows. Each fsync waits for the storage device
+        (slow on SD cards), so syncing every row would dominate write cost.
+        
+        Args:
+            csv_file: Path to CSV output file
+            batch_size: Number of rows buffered before flushing to disk
+            durable_every_n: Rows between fsyncs (0 = only fsync on close)
+        """
         self.csv_file = csv_file
-        self.fieldnames = [
-            'date_time',
-            'soil_temperature',
-            'soil_moisture',
-            'air_temperature',
-            'air_humidity',
-            'sunlight_visible',
-            'sunlight_uv',
-            'sunlight_ir',
-            'relay',
-            'relay_state_change'
-        ]
+        self.batch_size = batch_size
+        self.durable_every_n = durable_every_n
+        self.fieldnames = list(SensorReading._fields)
         self._ensure_output_dir()
         self._initialize_csv()
+        self._fh = open(self.csv_file, 'ab')
+        self._buf = bytearray()
+        self._soft_max = 128 * 1024
+        self._pending = 0
+        self._unsynced = 0
+        atexit.register(self.close)
 
     def _ensure_output_dir(self):
         """Create output directory if it doesn't exist."""
@@ -410,19 +573,63 @@ class CSVWriter:
         if not os.path.exists(self.csv_file):
             try:
                 with open(self.csv_file, 'w', newline='') as f:
-                    writer = csv.DictWriter(f, fieldnames=self.fieldnames)
-                    writer.writeheader()
+                    writer = csv.writer(f)
+                    writer.writerow(self.fieldnames)
             except Exception as e:
-                logging.error(f"Failed to initialize CSV file: {e}")
+                logging.error("Failed to initialize CSV file: %s", e)
 
-    def write_data(self, data_dict):
-        """Write sensor data to CSV file."""
+    def write_data(self, row):
+        """Write a row of sensor data to CSV file, flushing every batch_size rows."""
         try:
-            with open(self.csv_file, 'a', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=self.fieldnames)
-                writer.writerow(data_dict)
+            self._buf += self._format_row(row).encode('utf-8')
+            self._pending += 1
+            self._unsynced += 1
+            if self.durable_every_n and self._unsynced >= self.durable_every_n:
+                self.sync()
+            elif self._pending >= self.batch_size or len(self._buf) >= self._soft_max:
+                self.flush()
         except Exception as e:
-            logging.error(f"Failed to write to CSV file: {e}")
+            logging.error("Failed to write to CSV file: %s", e)
+
+    def _format_row(self, values):
+        """Format a row as a single CSV line."""
+        line = ",".join("" if v is None else str(v) for v in values)
+        # Values are plain numbers, so quoting is only needed for odd strings
+        if (line.count(',') != len(values) - 1 or '"' in line
+                or '\n' in line or '\r' in line):
+            buf = io.StringIO()
+            csv.writer(buf).writerow(values)
+            return buf.getvalue()
+        return line + "\r\n"
+
+    def flush(self):
+        """Flush buffered rows to the CSV file."""
+        if self._buf:
+            self._fh.write(self._buf)
+            # Drop an oversized buffer so one burst doesn't pin its memory
+            if len(self._buf) > self._soft_max:
+                self._buf = bytearray()
+            else:
+                self._buf.clear()
+        self._fh.flush()
+        self._pending = 0
+
+    def sync(self):
+        """Flush buffered rows and fsync the CSV file to stable storage."""
+        self.flush()
+        os.fsync(self._fh.fileno())
+        self._unsynced = 0
+
+    def close(self):
+        """Flush pending rows and close the CSV file."""
+        if self._fh.closed:
+            return
+        try:
+            self.sync()
+        except Exception as e:
+            logging.error("Failed to flush CSV file: %s", e)
+        finally:
+            self._fh.close()
 
 
 # ============================================================================
@@ -472,7 +679,7 @@ class SensorDataCollector:
     """Main application class for sensor data collection."""
     
     def __init__(self, csv_file='output/sensor_data.csv', log_file='sensor_collector.log', 
-                 polling_interval=5.0):
+                 polling_interval=5.0, batch_size=64, durable_every_n=0):
         """
         Initialize the sensor data collector.
         
@@ -480,6 +687,8 @@ class SensorDataCollector:
             csv_file: Path to CSV output file
             log_file: Path to log file
             polling_interval: Time between sensor readings in seconds
+            batch_size: Number of CSV rows buffered before flushing to disk
+            durable_every_n: CSV rows between fsyncs (0 = only fsync on stop)
         """
         self.logger = setup_logging(log_file)
         self.logger.info("=" * 60)
@@ -488,70 +697,125 @@ class SensorDataCollector:
         
         self.polling_interval = polling_interval
         self.sensor_poller = SensorPoller()
-        self.csv_writer = CSVWriter(csv_file)
+        self.csv_writer = CSVWriter(csv_file, batch_size, durable_every_n)
         self.running = False
         
-        self.logger.info(f"CSV output file: {csv_file}")
-        self.logger.info(f"Log file: {log_file}")
-        self.logger.info(f"Polling interval: {polling_interval} seconds")
+        # CSV rows are written on a background thread so file I/O never delays a poll
+        self._queue = queue.Queue(maxsize=1024)
+        self._writer_thread = None
+        
+        self.logger.info("CSV output file: %s", csv_file)
+        self.logger.info("Log file: %s", log_file)
+        self.logger.info("Polling interval: %s seconds", polling_interval)
+        self.logger.info("CSV batch size: %s rows", batch_size)
+        if durable_every_n:
+            self.logger.info("CSV fsync interval: %s rows", durable_every_n)
 
     def start(self):
         """Start the sensor data collection loop."""
         self.running = True
         self.logger.info("Starting sensor data collection...")
+        self._writer_thread = threading.Thread(target=self._writer_loop, name='csv-writer',
+                                               daemon=True)
+        self._writer_thread.start()
+        
+        # Signal handlers can only be installed from the main thread
+        previous_sigterm = None
+        if threading.current_thread() is threading.main_thread():
+            previous_sigterm = signal.signal(signal.SIGTERM, self._handle_sigterm)
         
         try:
-            while self.running:
-                try:
-                    # Poll all sensors
-                    self.sensor_poller.poll_sensors()
-                    
-                    # Get data as dictionary
-                    data = self.sensor_poller.get_data_dict()
-                    
-                    # Write to CSV
-                    self.csv_writer.write_data(data)
-                    
-                    # Log important events
-                    self._log_events(data)
-                    
-                    # Log successful reading
-                    self.logger.debug(f"Sensor data collected: {data['date_time']}")
-                    
-                except KeyboardInterrupt:
-                    self.logger.info("Received interrupt signal, shutting down...")
-                    self.running = False
-                    break
-                except Exception as e:
-                    self.logger.error(f"Error during sensor polling: {e}", exc_info=True)
-                
-                # Wait before next reading
-                time.sleep(self.polling_interval)
-                
+            asyncio.run(self._run())
+        except KeyboardInterrupt:
+            self.logger.info("Received interrupt signal, shutting down...")
         except Exception as e:
-            self.logger.error(f"Fatal error in main loop: {e}", exc_info=True)
+            self.logger.error("Fatal error in main loop: %s", e, exc_info=True)
         finally:
-            self.stop()
+            self._shutdown()
+            if previous_sigterm is not None:
+                signal.signal(signal.SIGTERM, previous_sigterm)
+
+    def _handle_sigterm(self, signum, frame):
+        """Handle SIGTERM like Ctrl+C so buffered rows are written on shutdown."""
+        raise KeyboardInterrupt
+
+    async def _run(self):
+        """Poll sensors and record data until stopped."""
+        # Schedule against a monotonic deadline so polling time doesn't add drift
+        next_poll = time.monotonic() + self.polling_interval
+        while self.running:
+            try:
+                # Poll all sensors
+                await self.sensor_poller.poll_sensors()
+                
+                # Get data as a row in CSV column order
+                data = self.sensor_poller.get_data_row()
+                
+                # Hand off to the CSV writer thread
+                self._queue.put(data)
+                
+                # Log important events
+                self._log_events(data)
+                
+                # Log successful reading
+                self.logger.debug("Sensor data collected: %s", data.date_time)
+                
+            except Exception as e:
+                self.logger.error("Error during sensor polling: %s", e, exc_info=True)
+            
+            # Wait until the next scheduled reading
+            now = time.monotonic()
+            if now > next_poll + self.polling_interval:
+                self.logger.warning("Polling fell %.2f seconds behind schedule, resynchronizing",
+                                    now - next_poll)
+                next_poll = now + self.polling_interval
+            await asyncio.sleep(max(0.0, next_poll - now))
+            next_poll += self.polling_interval
+
+    def _writer_loop(self):
+        """Write queued rows to the CSV file until a None sentinel arrives."""
+        while True:
+            row = self._queue.get()
+            if row is None:
+                break
+            self.csv_writer.write_data(row)
 
     def _log_events(self, data):
         """Log important events based on sensor data."""
         # Log relay state changes
-        if data.get('relay_state_change'):
-            self.logger.info(f"Relay state changed to: {data['relay']}")
+        if data.relay_state_change:
+            self.logger.info("Relay state changed to: %s", data.relay)
         
-        # Log sensor initialization issues
-        if data.get('soil_temperature') is None:
+        # Log sensor initialization issues; disabled sensors were reported at setup
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
+        poller = self.sensor_poller
+        if data.soil_temperature is None and not poller.soil_temperature_sensor.disabled:
             self.logger.warning("Soil temperature sensor returned None")
-        if data.get('soil_moisture') is None:
+        if data.soil_moisture is None and not poller.soil_moisture_sensor.disabled:
             self.logger.warning("Soil moisture sensor returned None")
-        if data.get('air_temperature') is None or data.get('air_humidity') is None:
+        if ((data.air_temperature is None or data.air_humidity is None)
+                and not poller.air_temperature_humidity_sensor.disabled):
             self.logger.warning("Air temperature/humidity sensor returned None")
-        if data.get('sunlight_visible') is None:
+        if data.sunlight_visible is None and not poller.sunlight_sensor.disabled:
             self.logger.warning("Sunlight sensor returned None")
 
     def stop(self):
-        """Stop the sensor data collection."""
+        """Stop the sensor data collection after the current poll."""
         self.running = False
+
+    def _shutdown(self):
+        """Write out queued rows and sync the CSV file once the loop has exited."""
+        self.running = False
+        if self._writer_thread is None:
+            return
+        self._queue.put(None)
+        self._writer_thread.join()
+        self._writer_thread = None
+        try:
+            self.csv_writer.sync()
+        except Exception as e:
+            self.logger.error("Failed to sync CSV file: %s", e)
         self.logger.info("Sensor data collection stopped")
         self.logger.info("=" * 60)
 
@@ -567,13 +831,19 @@ def main():
                        help='Path to log file (default: sensor_collector.log)')
     parser.add_argument('--interval', type=float, default=5.0,
                        help='Polling interval in seconds (default: 5.0)')
+    parser.add_argument('--batch-size', type=int, default=64,
+                       help='CSV rows buffered before flushing to disk (default: 64)')
+    parser.add_argument('--durable-every', type=int, default=0,
+                       help='CSV rows between fsyncs to stable storage (default: 0, only on exit)')
     
     args = parser.parse_args()
     
     collector = SensorDataCollector(
         csv_file=args.csv,
         log_file=args.log,
-        polling_interval=args.interval
+        polling_interval=args.interval,
+        batch_size=args.batch_size,
+        durable_every_n=args.durable_every
     )
     
     try:
@@ -581,7 +851,7 @@ def main():
     except KeyboardInterrupt:
         collector.logger.info("Application interrupted by user")
     except Exception as e:
-        collector.logger.error(f"Application error: {e}", exc_info=True)
+        collector.logger.error("Application error: %s", e, exc_info=True)
 
 
 if __name__ == '__main__':